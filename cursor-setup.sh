@@ -137,7 +137,7 @@ echo -e "${YELLOW}${BOLD}======= CURSOR SETUP INSTRUCTIONS =======${NC}"
 echo -e "1. Open Cursor"
 echo -e "2. Go to Settings → AI → Custom Tools"
 echo -e "3. Add a new tool with the URL:"
-echo -e "${GREEN}   http://${HOST}:${PORT}/sse${NC}"
+echo -e "${GREEN}   http://${HOST}:${PORT}/mcp${NC}"
 echo -e "4. Save the settings"
 echo -e "5. Restart Cursor to ensure the changes take effect"
 echo -e "${YELLOW}=======================================${NC}\n"
@@ -8,4 +8,4 @@ __version__ = "0.1.0"
 
 from devrev_mcp.client import DevRevClient
 from devrev_mcp.auth import DevRevAuth
-from devrev_mcp.errors import DevRevAPIError 
\ No newline at end of file
+from devrev_mcp.errors import DevRevAPIError, InvalidArgumentError 
\ No newline at end of file
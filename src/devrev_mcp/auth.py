@@ -1,66 +1,134 @@
 """
 Authentication handling for DevRev API.
 """
+import asyncio
+import hashlib
 import logging
-import requests
-from typing import Dict, Any, Optional
+import random
 import time
+from typing import Dict, Any, Optional, Tuple
 
-from devrev_mcp.config import config
-from devrev_mcp.errors import DevRevAPIError, handle_api_error
+import httpx
+
+from devrev_mcp.config import get_config
+from devrev_mcp.errors import parse_retry_after
 
 logger = logging.getLogger(__name__)
 
 # Constants
-API_BASE_URL = config.api.base_url
+API_BASE_URL = get_config().api.base_url
 DEV_USER_SELF_ENDPOINT = "/dev-users.self"
 
+# Successful validations, keyed by a SHA-256 digest so raw PATs are not stored
+_TOKEN_TTL = 300  # seconds
+_token_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+# Retry backoff bounds in seconds
+_RETRY_BASE_DELAY = 0.5
+_RETRY_MAX_DELAY = 30.0
+
+
+def _token_key(api_key: str) -> str:
+    """Return the cache key for an API key."""
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
 
 class DevRevAuth:
     """Handler for DevRev authentication."""
-    
+
+    # Shared HTTP client so validation requests reuse pooled connections;
+    # the token is sent per request so one client serves every key
+    _client: Optional[httpx.AsyncClient] = None
+
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client, creating it on first use.
+
+        Returns:
+            The shared asynchronous HTTP client
+        """
+        if cls._client is None:
+            cls._client = httpx.AsyncClient(
+                base_url=API_BASE_URL,
+                http2=True,
+                timeout=get_config().api.timeout,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                headers={"Content-Type": "application/json"},
+            )
+        return cls._client
+
+    @classmethod
+    async def close(cls) -> None:
+        """Close the shared HTTP client and release its pooled connections."""
+        if cls._client is not None:
+            await cls._client.aclose()
+            cls._client = None
+
     @staticmethod
-    def validate_token(api_key: str) -> Optional[Dict[str, Any]]:
+    def invalidate(api_key: str) -> None:
+        """
+        Drop a cached validation result, e.g. after the API rejected the token.
+
+        Args:
+            api_key: DevRev Personal Access Token (PAT)
+        """
+        _token_cache.pop(_token_key(api_key), None)
+
+    @classmethod
+    async def validate_token(cls, api_key: str) -> Optional[Dict[str, Any]]:
         """
         Validate the DevRev API key by requesting the current user's information.
-        
+
         Args:
             api_key: DevRev Personal Access Token (PAT)
-            
+
         Returns:
             User information if token is valid, None otherwise
         """
-        headers = {
-            "Authorization": api_key,
-            "Content-Type": "application/json",
-        }
-        
+        key = _token_key(api_key)
+        cached = _token_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _TOKEN_TTL:
+            return cached[1]
+
+        client = cls._get_client()
+        headers = {"Authorization": api_key}
+
         # Set up retry mechanism
-        max_retries = config.api.retries
-        timeout = config.api.timeout
-        
+        max_retries = get_config().api.retries
+        delay = _RETRY_BASE_DELAY
+
         for attempt in range(max_retries + 1):
             try:
-                response = requests.get(
-                    f"{API_BASE_URL}{DEV_USER_SELF_ENDPOINT}",
-                    headers=headers,
-                    timeout=timeout
-                )
-                
+                response = await client.get(DEV_USER_SELF_ENDPOINT, headers=headers)
+
                 response.raise_for_status()
                 user_data = response.json()
-                
+
                 logger.info("Token validated successfully")
-                return user_data.get("dev_user")
-            except requests.exceptions.RequestException as e:
+                dev_user = user_data.get("dev_user")
+                if dev_user:
+                    _token_cache[key] = (time.monotonic(), dev_user)
+                return dev_user
+            except httpx.HTTPError as e:
+                if isinstance(e, httpx.HTTPStatusError) and e.response.status_code == 401:
+                    cls.invalidate(api_key)
+
                 # If it's the last attempt, return None
                 if attempt == max_retries:
                     logger.error(f"Token validation failed after {max_retries + 1} attempts: {str(e)}")
-                    if hasattr(e, "response") and hasattr(e.response, "text"):
+                    if isinstance(e, httpx.HTTPStatusError):
                         logger.error(f"Response: {e.response.text}")
                     return None
-                
-                # Otherwise, retry with exponential backoff
-                wait_time = 2 ** attempt
-                logger.warning(f"Token validation failed. Retrying in {wait_time} seconds...")
-                time.sleep(wait_time) 
\ No newline at end of file
+
+                # Otherwise, retry with decorrelated jitter so concurrent callers
+                # spread out, unless the server said when to come back
+                delay = min(_RETRY_MAX_DELAY, random.uniform(_RETRY_BASE_DELAY, delay * 3))
+                wait_time = delay
+                if isinstance(e, httpx.HTTPStatusError):
+                    retry_after = parse_retry_after(e.response.headers)
+                    if retry_after is not None:
+                        wait_time = min(retry_after, _RETRY_MAX_DELAY)
+                logger.debug(f"Token validation attempt {attempt + 1} of {max_retries + 1} failed: {str(e)}")
+                logger.warning(f"Token validation failed. Retrying in {wait_time:.2f} seconds...")
+                await asyncio.sleep(wait_time)
@@ -0,0 +1,80 @@
+"""
+Caching utilities for DevRev MCP server.
+
+This module provides a small in-process cache for short-lived API results.
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Size-bounded LRU cache whose entries expire after a fixed time-to-live."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries before the least recently used is evicted
+            ttl: Seconds an entry stays valid; 0 disables caching
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+            default: Value to return on a miss or an expired entry
+
+        Returns:
+            The cached value, or default
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return default
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entries if the cache is full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        if self.ttl <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Remove a single entry if present.
+
+        Args:
+            key: Cache key
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including expired ones not yet purged."""
+        return len(self._entries)
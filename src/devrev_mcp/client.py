@@ -3,20 +3,23 @@ DevRev API client.
 
 This module provides a client for interacting with the DevRev API.
 """
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Union
+import random
 import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-import requests
+import httpx
+import orjson
 
-from devrev_mcp.errors import DevRevAPIError, handle_api_error
-from devrev_mcp.config import config
-from devrev_mcp.auth import DevRevAuth
+from devrev_mcp.cache import TTLCache
+from devrev_mcp.errors import DevRevAPIError, handle_api_error, parse_retry_after
+from devrev_mcp.config import get_config
 
 logger = logging.getLogger(__name__)
 
 # Constants from config
-API_BASE_URL = config.api.base_url
+API_BASE_URL = get_config().api.base_url
 SEARCH_ENDPOINT = "/search.core"
 WORKS_ENDPOINT = "/works.get"
 WORKS_LIST_ENDPOINT = "/works.list"
@@ -27,10 +30,141 @@ PARTS_LIST_ENDPOINT = "/parts.list"
 DEV_USERS_ENDPOINT = "/dev-users.get"
 DEV_USER_SELF_ENDPOINT = "/dev-users.self"
 
+# Full URL of each endpoint, joined once at import
+_FULL_URLS = {
+    endpoint: f"{API_BASE_URL}{endpoint}"
+    for endpoint in (
+        SEARCH_ENDPOINT,
+        WORKS_ENDPOINT,
+        WORKS_LIST_ENDPOINT,
+        WORKS_CREATE_ENDPOINT,
+        WORKS_UPDATE_ENDPOINT,
+        PARTS_ENDPOINT,
+        PARTS_LIST_ENDPOINT,
+        DEV_USERS_ENDPOINT,
+        DEV_USER_SELF_ENDPOINT,
+    )
+}
+
+# Response field holding the payload of each endpoint, with a factory for the
+# value returned when it is missing (a fresh object, so callers may mutate it)
+_RESPONSE_KEYS: Dict[str, Tuple[str, Callable[[], Any]]] = {
+    SEARCH_ENDPOINT: ("results", list),
+    WORKS_LIST_ENDPOINT: ("works", list),
+    WORKS_CREATE_ENDPOINT: ("work", dict),
+    WORKS_UPDATE_ENDPOINT: ("work", dict),
+    PARTS_ENDPOINT: ("part", dict),
+    PARTS_LIST_ENDPOINT: ("parts", list),
+}
+
+# Object types accepted by the search endpoint, in documentation order
+NAMESPACES = (
+    "account", "article", "capability", "component", "conversation",
+    "custom_object", "custom_part", "custom_work", "dashboard", "dev_user",
+    "enhancement", "feature", "group", "issue", "linkable", "microservice",
+    "object_member", "operation", "opportunity", "part", "product", "project",
+    "question_answer", "rev_org", "rev_user", "runnable", "service_account",
+    "sys_user", "tag", "task", "ticket", "vista", "workflow", "comment"
+)
+SUPPORTED_NAMESPACES = frozenset(NAMESPACES)
+
+# Namespaces whose API name differs from the public one; all others map to themselves
+_NAMESPACE_MAP = {"article": "artifact"}
+
+# Object type for each 4-character ID prefix
+_OBJECT_TYPE_BY_PREFIX = {
+    "ISS-": "issue",
+    "TKT-": "ticket",
+    "ART-": "article",
+    "DEVU": "user",
+}
+
+# Part types accepted by the parts endpoints
+PART_TYPES = ("capability", "enhancement", "feature", "linkable", "runnable", "product")
+SUPPORTED_PART_TYPES = frozenset(PART_TYPES)
+
+# Retry backoff bounds in seconds, the methods safe to resend, and the
+# response statuses and transport errors worth retrying
+_RETRY_BASE_DELAY = 0.5
+_RETRY_MAX_DELAY = 30.0
+_RETRY_METHODS = frozenset({"GET"})
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_ERRORS = (
+    httpx.ReadError,
+    httpx.ReadTimeout,
+    httpx.WriteError,
+    httpx.WriteTimeout,
+    httpx.RemoteProtocolError,
+)
+
+# Seconds before the cached current user is fetched again
+CURRENT_USER_TTL = 3600
+
+# Size and lifetime of the per-client caches for object and part lookups
+_LOOKUP_CACHE_SIZE = 256
+_LOOKUP_CACHE_TTL = 60  # seconds
+
+
+class _CircuitBreaker:
+    """Circuit breaker that stops calls to a failing backend and lets a probe through after a cool-down."""
+
+    def __init__(self, threshold: int, cooldown: float) -> None:
+        """
+        Initialize the circuit breaker in the closed state.
+        
+        Args:
+            threshold: Consecutive failures that open the circuit
+            cooldown: Seconds to fail fast before probing the backend again
+        """
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may be sent.
+        
+        Returns:
+            False while the circuit is open or a probe is in flight, True otherwise
+        """
+        if self.state == "closed":
+            return True
+        
+        # Open: wait out the cool-down, then let one probe through. Half-open:
+        # allow another probe if the previous one never reported back.
+        now = time.monotonic()
+        if now - self.opened_at < self.cooldown:
+            return False
+        self.state = "half_open"
+        self.opened_at = now
+        return True
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        if self.state != "closed":
+            logger.info("DevRev API recovered; closing circuit breaker")
+        self.state = "closed"
+        self.failures = 0
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening the circuit when the threshold is reached or a probe fails."""
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.threshold:
+            if self.state != "open":
+                logger.warning(f"Opening circuit breaker for {self.cooldown} seconds after {self.failures} failures")
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
 
 class DevRevClient:
     """Client for interacting with the DevRev API."""
 
+    # HTTP client shared by all instances so pooled connections outlive any
+    # one client; credentials are sent per request
+    _http: Optional[httpx.AsyncClient] = None
+
     def __init__(self, api_key: str, current_user: Dict[str, Any] = None) -> None:
         """
         Initialize the DevRev client.
@@ -39,16 +173,78 @@ class DevRevClient:
             api_key: DevRev Personal Access Token (PAT)
             current_user: Current user information (if already available from auth)
         """
+        api_config = get_config().api
         self.api_key = api_key
         self.headers = {
             "Authorization": api_key,
             "Content-Type": "application/json",
         }
-        self.timeout = config.api.timeout
-        self.max_retries = config.api.retries
-        self._current_user = current_user
+        self.timeout = api_config.timeout
+        self.max_retries = api_config.retries
+        # A user without an ID is ignored and fetched again on first use
+        self._current_user = current_user if current_user and current_user.get("id") else None
+        self._current_user_fetched_at = time.monotonic() if self._current_user else 0.0
+        self._current_user_lock = asyncio.Lock()
+        self._object_cache = TTLCache(maxsize=_LOOKUP_CACHE_SIZE, ttl=_LOOKUP_CACHE_TTL)
+        self._part_cache = TTLCache(maxsize=_LOOKUP_CACHE_SIZE, ttl=_LOOKUP_CACHE_TTL)
+        # Bulkhead: bounds in-flight requests so bursts cannot exhaust sockets or trip rate limits
+        self._inflight = asyncio.Semaphore(api_config.max_concurrency)
+        self._breaker = _CircuitBreaker(api_config.breaker_threshold, api_config.breaker_cooldown)
         logger.info("DevRev client initialized")
 
+    @classmethod
+    def _get_http_client(cls) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client used for API requests, creating it on first use.
+        
+        The client keeps connections alive between requests, so TCP and TLS
+        setup is paid once rather than per call. Its transport retries failed
+        connection attempts, which never reached the server and are safe to
+        repeat for any method.
+        
+        Returns:
+            The asynchronous HTTP client
+        """
+        if cls._http is None:
+            api_config = get_config().api
+            transport = httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=api_config.retries,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            )
+            cls._http = httpx.AsyncClient(transport=transport, timeout=api_config.timeout)
+        return cls._http
+
+    @classmethod
+    async def close(cls) -> None:
+        """Close the shared HTTP client and release its pooled connections."""
+        if cls._http is not None:
+            await cls._http.aclose()
+            cls._http = None
+
+    async def _get_current_user_id(self) -> str:
+        """
+        Get the authenticated user's ID, fetching it from DevRev when not cached or stale.
+        
+        Returns:
+            ID of the current user
+        """
+        if self._current_user and time.monotonic() - self._current_user_fetched_at < CURRENT_USER_TTL:
+            return self._current_user["id"]
+        
+        # Only one caller refreshes; the others wait and reuse its result
+        async with self._current_user_lock:
+            if not self._current_user or time.monotonic() - self._current_user_fetched_at >= CURRENT_USER_TTL:
+                data = await self._make_request("GET", DEV_USER_SELF_ENDPOINT)
+                dev_user = data.get("dev_user")
+                # Never cache a user without an ID: owned_by="self" would silently drop its filter
+                if not dev_user or not dev_user.get("id"):
+                    raise DevRevAPIError("DevRev API returned no current user", 502, orjson.dumps(data).decode())
+                self._current_user = dev_user
+                self._current_user_fetched_at = time.monotonic()
+        
+        return self._current_user["id"]
+
     async def search(
         self, query: str, namespace: str
     ) -> List[Dict[str, Any]]:
@@ -64,65 +260,17 @@ class DevRevClient:
         """
         logger.info(f"Searching for '{query}' in namespace '{namespace}'")
         
-        # Complete list of valid DevRev namespaces
-        valid_namespaces = [
-            "account", "article", "capability", "component", "conversation",
-            "custom_object", "custom_part", "custom_work", "dashboard", "dev_user",
-            "enhancement", "feature", "group", "issue", "linkable", "microservice",
-            "object_member", "operation", "opportunity", "part", "product", "project",
-            "question_answer", "rev_org", "rev_user", "runnable", "service_account",
-            "sys_user", "tag", "task", "ticket", "vista", "workflow", "comment"
-        ]
-        
-        if namespace not in valid_namespaces:
+        if namespace not in SUPPORTED_NAMESPACES:
             logger.warning(f"Invalid namespace: {namespace}, defaulting to 'issue'")
             namespace = "issue"
         
-        # Map namespace to DevRev's API namespaces format
-        namespace_map = {
-            "account": "account",
-            "article": "artifact",
-            "capability": "capability",
-            "component": "component",
-            "conversation": "conversation",
-            "comment": "comment",
-            "custom_object": "custom_object",
-            "custom_part": "custom_part",
-            "custom_work": "custom_work",
-            "dashboard": "dashboard",
-            "dev_user": "dev_user",
-            "enhancement": "enhancement",
-            "feature": "feature",
-            "group": "group",
-            "issue": "issue",
-            "linkable": "linkable",
-            "microservice": "microservice",
-            "object_member": "object_member",
-            "operation": "operation",
-            "opportunity": "opportunity",
-            "part": "part",
-            "product": "product",
-            "project": "project",
-            "question_answer": "question_answer",
-            "rev_org": "rev_org",
-            "rev_user": "rev_user",
-            "runnable": "runnable",
-            "service_account": "service_account",
-            "sys_user": "sys_user",
-            "tag": "tag",
-            "task": "task",
-            "ticket": "ticket",
-            "vista": "vista",
-            "workflow": "workflow"
-        }
-        
         # Build the API endpoint
         endpoint = SEARCH_ENDPOINT
         
         # Using GET request as per documentation
         params = {
             "query": query,
-            "namespaces": namespace_map.get(namespace, "issue"),
+            "namespaces": _NAMESPACE_MAP.get(namespace, namespace),
             "limit": 10
         }
         
@@ -149,7 +297,7 @@ class DevRevClient:
         # If owned_by is "self", use the current user's ID
         actual_owned_by = owned_by
         if owned_by == "self":
-            actual_owned_by = self._current_user.get("id")
+            actual_owned_by = await self._get_current_user_id()
             logger.info(f"Using current user ID: {actual_owned_by}")
         
         logger.info(f"Listing works of type '{work_type}' owned by '{actual_owned_by}'")
@@ -200,24 +348,19 @@ class DevRevClient:
         logger.info(f"Creating {work_type} with title '{title}'")
         
         # Get current user ID for owned_by field
-        owned_by = [self._current_user.get("id")] if self._current_user else []
-        
-        # Build request payload
-        payload = {
-            "type": work_type,
-            "title": title,
-            "owned_by": owned_by
-        }
-        
-        # Add applies_to_part if provided
-        if applies_to_part:
-            payload["applies_to_part"] = applies_to_part
-            
-        # Add body if provided
-        if body:
-            payload["body"] = body
-        
-        return await self._make_request("POST", WORKS_CREATE_ENDPOINT, json=payload)
+        current_user_id = await self._get_current_user_id()
+        
+        # Build request payload, leaving out fields that were not provided
+        fields = (
+            ("type", work_type),
+            ("title", title),
+            ("owned_by", [current_user_id] if current_user_id else None),
+            ("applies_to_part", applies_to_part or None),
+            ("body", body or None),
+        )
+        payload = {key: value for key, value in fields if value is not None}
+        
+        return await self._make_request("POST", WORKS_CREATE_ENDPOINT, content=orjson.dumps(payload))
     
     async def get_part(self, part_id: str) -> Dict[str, Any]:
         """
@@ -234,12 +377,19 @@ class DevRevClient:
         """
         logger.info(f"Getting part with ID: {part_id}")
         
+        part = self._part_cache.get(part_id)
+        if part is not None:
+            logger.debug(f"Part cache hit: {part_id}")
+            return part
+        
         # Build query params
         params = {
             "id": part_id
         }
         
-        return await self._make_request("GET", PARTS_ENDPOINT, params=params)
+        part = await self._make_request("GET", PARTS_ENDPOINT, params=params)
+        self._part_cache.set(part_id, part)
+        return part
     
     async def list_parts(
         self, part_type: str, cursor: Optional[str] = None, parent_part: Optional[str] = None
@@ -261,8 +411,7 @@ class DevRevClient:
         logger.info(f"Listing parts of type '{part_type}'")
         
         # Validate part type (although the API should do this as well)
-        valid_types = ["capability", "enhancement", "feature", "linkable", "runnable", "product"]
-        if part_type.lower() not in valid_types:
+        if part_type.lower() not in SUPPORTED_PART_TYPES:
             logger.warning(f"Invalid part type: {part_type}, but proceeding with request")
         
         # Build the API endpoint with query parameters
@@ -291,6 +440,11 @@ class DevRevClient:
         """
         logger.info(f"Getting object with ID: {object_id}")
         
+        cached = self._object_cache.get(object_id)
+        if cached is not None:
+            logger.debug(f"Object cache hit: {object_id}")
+            return cached
+        
         # Determine the object type from the ID prefix
         object_type = self._determine_object_type(object_id)
         
@@ -305,7 +459,25 @@ class DevRevClient:
         else:
             raise ValueError(f"Unsupported object ID format: {object_id}")
         
-        return await self._make_request("GET", f"{endpoint}?id={object_id}")
+        details = await self._make_request("GET", endpoint, params={"id": object_id})
+        self._object_cache.set(object_id, details)
+        return details
+
+    async def get_objects(
+        self, object_ids: List[str]
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Get several DevRev objects concurrently.
+        
+        Args:
+            object_ids: IDs of the objects (e.g., ISS-123, TKT-456)
+            
+        Returns:
+            Object details in the same order as object_ids; a failed lookup
+            yields its exception instead of failing the whole batch
+        """
+        # Concurrency is bounded by the client's bulkhead
+        return await asyncio.gather(*(self.get_object(object_id) for object_id in object_ids), return_exceptions=True)
 
     async def _make_request(
         self, method: str, endpoint: str, **kwargs
@@ -313,6 +485,9 @@ class DevRevClient:
         """
         Make an HTTP request to the DevRev API with retry logic.
         
+        Requests fail fast with a 503 DevRevAPIError while the circuit breaker
+        is open after repeated server or network failures.
+        
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint
@@ -321,52 +496,90 @@ class DevRevClient:
         Returns:
             Response data
         """
-        url = f"{API_BASE_URL}{endpoint}"
-        kwargs.setdefault("timeout", self.timeout)
-        kwargs.setdefault("headers", self.headers)
+        if method not in ("GET", "POST"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        
+        if not self._breaker.allow_request():
+            raise DevRevAPIError("DevRev API is unavailable; circuit breaker is open", 503)
+        
+        try:
+            url = _FULL_URLS.get(endpoint) or f"{API_BASE_URL}{endpoint}"
+            data = await self._send_with_retries(method, url, **kwargs)
+        except DevRevAPIError as e:
+            # Client errors prove the backend is reachable
+            if e.status_code >= 500:
+                self._breaker.record_failure()
+            else:
+                self._breaker.record_success()
+            raise
+        except Exception:
+            self._breaker.record_failure()
+            raise
+        self._breaker.record_success()
+        
+        # Process the response based on the endpoint
+        unwrap = _RESPONSE_KEYS.get(endpoint)
+        if unwrap is None:
+            return data
+        key, default_factory = unwrap
+        return data[key] if key in data else default_factory()
+
+    async def _send_with_retries(self, method: str, url: str, **kwargs) -> Dict[str, Any]:
+        """
+        Send an HTTP request, retrying transient failures with backoff.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: Full request URL
+            **kwargs: Additional arguments to pass to the request
+            
+        Returns:
+            Decoded JSON response body
+        """
+        http = self._get_http_client()
         
+        # Only idempotent requests are resent; a POST may have been applied
+        # even if the response was lost
+        max_retries = self.max_retries if method in _RETRY_METHODS else 0
         retries = 0
-        while retries <= self.max_retries:
+        while True:
             try:
-                if method == "GET":
-                    response = requests.get(url, **kwargs)
-                elif method == "POST":
-                    response = requests.post(url, **kwargs)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
-                
+                async with self._inflight:
+                    response = await http.request(method, url, headers=self.headers, **kwargs)
                 response.raise_for_status()
-                data = response.json()
-                
-                # Process the response based on the endpoint
-                if endpoint == SEARCH_ENDPOINT:
-                    return data.get("results", [])
-                elif endpoint == WORKS_LIST_ENDPOINT:
-                    return data.get("works", [])
-                elif endpoint == WORKS_CREATE_ENDPOINT:
-                    return data.get("work", {})
-                elif endpoint == WORKS_UPDATE_ENDPOINT:
-                    return data.get("work", {})
-                elif endpoint == PARTS_ENDPOINT:
-                    return data.get("part", {})
-                elif endpoint == PARTS_LIST_ENDPOINT:
-                    return data.get("parts", [])
+                return orjson.loads(response.content)
                 
-                return data
+            except httpx.HTTPError as e:
+                # Only transient read/write failures are retried here; connection
+                # failures were already retried by the transport
+                status_code = e.response.status_code if isinstance(e, httpx.HTTPStatusError) else None
+                retryable = (
+                    status_code in _RETRY_STATUSES
+                    if status_code is not None
+                    else isinstance(e, _RETRY_ERRORS)
+                )
                 
-            except requests.exceptions.RequestException as e:
-                # If we've reached the maximum retries, handle the error
-                if retries >= self.max_retries:
+                # If the error is permanent or we've reached the maximum retries, handle the error
+                if not retryable or retries >= max_retries:
                     handle_api_error(e)
+                    raise
                 
-                # Otherwise, retry with exponential backoff
+                # Otherwise, retry with full-jitter exponential backoff so clients
+                # that failed together do not retry in lockstep
                 retries += 1
-                wait_time = 2 ** retries  # Exponential backoff
-                logger.warning(f"Request failed. Retrying in {wait_time} seconds...")
-                time.sleep(wait_time)
-        
-        # This should never be reached due to handle_api_error raising an exception
-        raise Exception("Maximum retries exceeded")
+                wait_time = random.uniform(0, min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2 ** retries))
+                delay_source = "backoff"
+                
+                # Rate limiting and maintenance responses say when to come back,
+                # bounded so one header cannot hold the call indefinitely
+                if status_code in (429, 503):
+                    retry_after = parse_retry_after(e.response.headers)
+                    if retry_after is not None and retry_after > wait_time:
+                        wait_time = min(retry_after, _RETRY_MAX_DELAY)
+                        delay_source = "Retry-After"
+                
+                logger.warning(f"Request failed. Retrying in {wait_time:.2f} seconds ({delay_source})...")
+                await asyncio.sleep(wait_time)
 
     def _determine_object_type(self, object_id: str) -> str:
         """
@@ -378,18 +591,12 @@ class DevRevClient:
         Returns:
             Object type (issue, ticket, article)
         """
-        if object_id.startswith("ISS-"):
-            return "issue"
-        elif object_id.startswith("TKT-"):
-            return "ticket"
-        elif object_id.startswith("ART-"):
-            return "article"
-        elif object_id == "SELF" or object_id.startswith("DEVU-"):
+        if object_id == "SELF":
             # Special case for dev-users.self endpoint
             return "user"
-        else:
-            # If we can't determine the type, try to use the full DON ID
-            return "unknown"
+        
+        # If we can't determine the type, try to use the full DON ID
+        return _OBJECT_TYPE_BY_PREFIX.get(object_id[:4], "unknown")
 
     async def update_work(
         self, work_id: str, title: str = None, applies_to_part: Optional[str] = None, 
@@ -412,23 +619,16 @@ class DevRevClient:
         logger.info(f"Updating work with ID {work_id}")
         
         # Build request payload with only provided fields
-        payload = {
-            "id": work_id
-        }
-        
-        if title is not None:
-            payload["title"] = title
-            
-        if applies_to_part is not None:
-            payload["applies_to_part"] = applies_to_part
-            
-        if body is not None:
-            payload["body"] = body
-            
-        if stage is not None:
-            payload["stage"] = stage
-            
-        if status is not None:
-            payload["status"] = status
-        
-        return await self._make_request("POST", WORKS_UPDATE_ENDPOINT, json=payload) 
\ No newline at end of file
+        fields = (
+            ("id", work_id),
+            ("title", title),
+            ("applies_to_part", applies_to_part),
+            ("body", body),
+            ("stage", stage),
+            ("status", status),
+        )
+        payload = {key: value for key, value in fields if value is not None}
+        
+        work = await self._make_request("POST", WORKS_UPDATE_ENDPOINT, content=orjson.dumps(payload))
+        self._object_cache.invalidate(work_id)
+        return work 
\ No newline at end of file
@@ -3,37 +3,46 @@ Configuration module for DevRev MCP server.
 
 This module handles configuration loading and validation.
 """
+import functools
 import os
 import logging
-from typing import Dict, Any, Optional
-
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
 
-class ServerConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ServerConfig:
     """Server configuration model."""
     
-    host: str = Field(default="127.0.0.1")
-    port: int = Field(default=8888)
-    log_level: str = Field(default="info")
-    debug: bool = Field(default=False)
+    host: str = "127.0.0.1"
+    port: int = 8888
+    log_level: str = "info"
+    debug: bool = False
+    enable_file_logging: bool = True
+    transport: str = "streamable-http"  # MCP transport: streamable-http or sse
 
 
-class APIConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class APIConfig:
     """API configuration model."""
     
-    base_url: str = Field(default="https://api.devrev.ai")
-    timeout: int = Field(default=10)  # Request timeout in seconds
-    retries: int = Field(default=3)   # Number of retry attempts
+    base_url: str = "https://api.devrev.ai"
+    timeout: int = 10  # Request timeout in seconds
+    retries: int = 3   # Number of retry attempts
+    max_concurrency: int = 8  # Maximum in-flight API requests per client
+    search_cache_ttl: int = 15  # Seconds to reuse identical search results
+    breaker_threshold: int = 5  # Consecutive failures that open the circuit breaker
+    breaker_cooldown: int = 30  # Seconds to fail fast before probing again
 
 
-class Config(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Config:
     """Main configuration model."""
     
-    server: ServerConfig = Field(default_factory=ServerConfig)
-    api: APIConfig = Field(default_factory=APIConfig)
+    server: ServerConfig = field(default_factory=ServerConfig)
+    api: APIConfig = field(default_factory=APIConfig)
     api_key: Optional[str] = None
 
 
@@ -53,6 +62,8 @@ def load_config() -> Config:
         port=int(os.environ.get("DEVREV_MCP_PORT", "8888")),
         log_level=os.environ.get("DEVREV_MCP_LOG_LEVEL", "info"),
         debug=os.environ.get("DEVREV_MCP_DEBUG", "").lower() in ("true", "1", "yes"),
+        enable_file_logging=os.environ.get("DEVREV_MCP_FILE_LOGGING", "true").lower() in ("true", "1", "yes"),
+        transport=os.environ.get("DEVREV_MCP_TRANSPORT", "streamable-http"),
     )
     
     # Get API configuration from environment
@@ -60,6 +71,10 @@ def load_config() -> Config:
         base_url=os.environ.get("DEVREV_API_BASE_URL", "https://api.devrev.ai"),
         timeout=int(os.environ.get("DEVREV_API_TIMEOUT", "30")),
         retries=int(os.environ.get("DEVREV_API_RETRIES", "3")),
+        max_concurrency=int(os.environ.get("DEVREV_API_MAX_CONCURRENCY", "8")),
+        search_cache_ttl=int(os.environ.get("DEVREV_SEARCH_CACHE_TTL", "15")),
+        breaker_threshold=int(os.environ.get("DEVREV_API_BREAKER_THRESHOLD", "5")),
+        breaker_cooldown=int(os.environ.get("DEVREV_API_BREAKER_COOLDOWN", "30")),
     )
     
     return Config(
@@ -69,5 +84,13 @@ def load_config() -> Config:
     )
 
 
-# Global configuration instance
-config = load_config() 
\ No newline at end of file
+@functools.cache
+def get_config() -> Config:
+    """
+    Get the configuration, loading it from the environment on first use.
+    
+    Returns:
+        Config: Configuration object
+    """
+    return load_config()
+
@@ -2,10 +2,12 @@
 Error handling utilities for DevRev API.
 """
 import logging
-import json
-from typing import Dict, Optional, Any, Tuple
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional, Any, Tuple
 
-import requests
+import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -42,11 +44,11 @@ class DevRevAPIError(Exception):
             return {}
             
         try:
-            data = json.loads(response_body)
+            data = orjson.loads(response_body)
             if isinstance(data, dict):
                 return data
             return {"raw_error": data}
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             return {"raw_error": response_body}
     
     def __str__(self) -> str:
@@ -56,12 +58,16 @@ class DevRevAPIError(Exception):
         return f"{self.message} (Status: {self.status_code})"
 
 
-def handle_api_error(error: requests.exceptions.RequestException) -> Tuple[str, int]:
+class InvalidArgumentError(ValueError):
+    """Exception raised when a tool is called with an unsupported argument value."""
+
+
+def handle_api_error(error: httpx.HTTPError) -> Tuple[str, int]:
     """
-    Handle request exceptions and return a standardized error message and status code.
+    Handle HTTP exceptions and return a standardized error message and status code.
     
     Args:
-        error: Request exception
+        error: HTTP exception
         
     Returns:
         Tuple of (error_message, status_code)
@@ -69,18 +75,18 @@ def handle_api_error(error: requests.exceptions.RequestException) -> Tuple[str,
     status_code = 500  # Default to internal server error
     message = "An error occurred while communicating with the DevRev API"
     
-    if hasattr(error, "response") and error.response is not None:
+    if isinstance(error, httpx.HTTPStatusError):
         status_code = error.response.status_code
         response_body = getattr(error.response, "text", "")
         
         # Try to extract more specific error information
         try:
-            error_data = error.response.json()
+            error_data = orjson.loads(error.response.content)
             if "message" in error_data:
                 message = error_data["message"]
             elif "error" in error_data:
                 message = error_data["error"]
-        except (json.JSONDecodeError, ValueError, AttributeError):
+        except (orjson.JSONDecodeError, ValueError, AttributeError):
             # If we can't parse JSON, use the status code to provide info
             if status_code == 401:
                 message = "Authentication failed. Please check your API key."
@@ -100,4 +106,33 @@ def handle_api_error(error: requests.exceptions.RequestException) -> Tuple[str,
     
     # For network or connection errors
     logger.error(f"Network error: {str(error)}")
-    return "Could not connect to DevRev API. Please check your internet connection.", 503 
\ No newline at end of file
+    return "Could not connect to DevRev API. Please check your internet connection.", 503
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Parse the Retry-After header of a response.
+    
+    Args:
+        headers: Response headers
+        
+    Returns:
+        Seconds to wait before retrying, or None if the header is missing or invalid.
+        The value is not capped; callers bound it to their own maximum delay.
+    """
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    
+    # The header is either a non-negative integer number of seconds or an HTTP date
+    value = value.strip()
+    if value.isascii() and value.isdigit():
+        return float(value)
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,161 @@
+"""
+Tests for the DevRev API client.
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from devrev_mcp import client as client_module
+from devrev_mcp.client import DevRevClient, WORKS_ENDPOINT, _CircuitBreaker
+from devrev_mcp.errors import DevRevAPIError
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record retry delays instead of sleeping."""
+    recorded = []
+
+    async def fake_sleep(delay):
+        recorded.append(delay)
+
+    monkeypatch.setattr(client_module.asyncio, "sleep", fake_sleep)
+    return recorded
+
+
+def _run_with_transport(handler, call):
+    """Run call(client) against a client whose requests are answered by handler."""
+
+    async def run():
+        DevRevClient._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            return await call(DevRevClient("test-key"))
+        finally:
+            await DevRevClient.close()
+
+    return asyncio.run(run())
+
+
+def _send_with_responses(responses):
+    """Send one GET through a client whose transport replays the given responses."""
+    replies = iter(responses)
+    return _run_with_transport(
+        lambda request: next(replies),
+        lambda client: client._send_with_retries("GET", "https://api.devrev.ai/works.get"),
+    )
+
+
+def _open_breaker(threshold=3, cooldown=30):
+    """Return a circuit breaker that has just opened."""
+    breaker = _CircuitBreaker(threshold, cooldown)
+    for _ in range(threshold):
+        breaker.record_failure()
+    return breaker
+
+
+def _expire_cooldown(breaker):
+    """Move the breaker's open timestamp back past its cool-down."""
+    breaker.opened_at -= breaker.cooldown
+
+
+@pytest.mark.parametrize("status_code", [429, 503])
+@pytest.mark.parametrize("retry_after", ["86400", "Fri, 01 Jan 2099 00:00:00 GMT"])
+def test_retry_after_is_capped(sleeps, status_code, retry_after):
+    result = _send_with_responses([
+        httpx.Response(status_code, headers={"Retry-After": retry_after}),
+        httpx.Response(200, json={"ok": True}),
+    ])
+
+    assert result == {"ok": True}
+    assert sleeps == [client_module._RETRY_MAX_DELAY]
+
+
+@pytest.mark.parametrize("status_code", [429, 503])
+def test_short_retry_after_is_honored(sleeps, status_code):
+    result = _send_with_responses([
+        httpx.Response(status_code, headers={"Retry-After": "1"}),
+        httpx.Response(200, json={"ok": True}),
+    ])
+
+    # The first backoff is at most one second, so the hint wins
+    assert result == {"ok": True}
+    assert sleeps == [1.0]
+
+
+def test_breaker_opens_at_threshold():
+    breaker = _CircuitBreaker(threshold=3, cooldown=30)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    assert breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow_request()
+
+
+def test_breaker_fails_fast_during_cooldown(sleeps):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(500)
+
+    async def call(client):
+        client._breaker = _CircuitBreaker(threshold=1, cooldown=30)
+        with pytest.raises(DevRevAPIError) as first:
+            await client._make_request("GET", WORKS_ENDPOINT)
+        sent = len(requests)
+        with pytest.raises(DevRevAPIError) as second:
+            await client._make_request("GET", WORKS_ENDPOINT)
+        return first.value, second.value, sent
+
+    first, second, sent = _run_with_transport(handler, call)
+
+    assert first.status_code == 500
+    assert second.status_code == 503
+    assert len(requests) == sent
+
+
+def test_breaker_allows_one_half_open_probe():
+    breaker = _open_breaker()
+    _expire_cooldown(breaker)
+
+    assert breaker.allow_request()
+    assert breaker.state == "half_open"
+    assert not breaker.allow_request()
+
+
+def test_breaker_closes_on_successful_probe():
+    breaker = _open_breaker()
+    _expire_cooldown(breaker)
+    breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.failures == 0
+    assert breaker.allow_request()
+
+
+def test_breaker_closes_on_client_error_probe():
+    async def call(client):
+        client._breaker = _open_breaker()
+        _expire_cooldown(client._breaker)
+        with pytest.raises(DevRevAPIError) as error:
+            await client._make_request("GET", WORKS_ENDPOINT)
+        return client._breaker, error.value
+
+    breaker, error = _run_with_transport(lambda request: httpx.Response(404), call)
+
+    assert error.status_code == 404
+    assert breaker.state == "closed"
+
+
+def test_breaker_reopens_when_probe_fails():
+    breaker = _open_breaker()
+    _expire_cooldown(breaker)
+    breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow_request()